@@ -1,16 +1,19 @@
 import sys
 import os
-import threading
 import time
 import queue
 import logging
+import threading
 import glob  # Add this import for checking V4L2 devices
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from types import MappingProxyType
 
-from PyQt6.QtCore import Qt, QTimer, QSize, QMetaObject, Q_ARG
+from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QMessageBox, QSizePolicy, QDialog, QTextEdit
+    QPushButton, QLabel, QMessageBox, QSizePolicy, QDialog, QPlainTextEdit
 )
 from PyQt6.QtMultimedia import (
     QMediaDevices, QCamera, QMediaCaptureSession,
@@ -19,218 +22,434 @@ from PyQt6.QtMultimedia import (
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
 from smartcard.System import readers
-from smartcard.util import toHexString, toBytes
+from smartcard.CardMonitoring import CardMonitor, CardObserver
 from smartcard.Exceptions import NoCardException, CardConnectionException
 from datetime import datetime
 import cv2
 import platform
 import numpy as np
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG,
+from emv_tags import EMV_TAGS
+
+# Set up logging (set LOGLEVEL=DEBUG for APDU and card traces)
+log_level = (os.environ.get('LOGLEVEL') or 'INFO').upper()
+valid_log_level = isinstance(logging.getLevelName(log_level), int)
+logging.basicConfig(level=log_level if valid_log_level else logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
-
-# EMV Tag Definitions
-EMV_TAGS = {
-    # Template Tags
-    '6F': 'File Control Information (FCI) Template',
-    '70': 'Record Template',
-    '77': 'Response Message Template Format 2',
-    '80': 'Response Message Template Format 1',
-    '84': 'Dedicated File (DF) Name',
-    'A5': 'File Control Information (FCI) Proprietary Template',
-    '61': 'Application Template',
-    
-    # Basic Data Elements
-    '42': 'Issuer Identification Number (IIN)',
-    '4F': 'Application Identifier (AID)',
-    '50': 'Application Label',
-    '56': 'Track 1 Equivalent Data (Magnetic Stripe Data)',
-    '57': 'Track 2 Equivalent Data',
-    '5A': 'Application Primary Account Number (PAN)',
-    '5F20': 'Cardholder Name',
-    '5F24': 'Application Expiration Date',
-    '5F25': 'Application Effective Date',
-    '5F28': 'Issuer Country Code',
-    '5F2A': 'Transaction Currency Code',
-    '5F2D': 'Language Preference',
-    '5F30': 'Service Code',
-    '5F34': 'Application PAN Sequence Number',
-    '5F36': 'Transaction Currency Exponent',
-    
-    # Processing Tags
-    '82': 'Application Interchange Profile',
-    '83': 'Command Template',
-    '86': 'Issuer Script Command',
-    '87': 'Application Priority Indicator',
-    '88': 'Short File Identifier (SFI)',
-    '89': 'Authorization Code',
-    '8A': 'Authorization Response Code',
-    '8C': 'Card Risk Management Data Object List 1 (CDOL1)',
-    '8D': 'Card Risk Management Data Object List 2 (CDOL2)',
-    '8E': 'Cardholder Verification Method (CVM) List',
-    '8F': 'Certification Authority Public Key Index',
-    '90': 'Issuer Public Key Certificate',
-    '91': 'Issuer Authentication Data',
-    '92': 'Issuer Public Key Remainder',
-    '93': 'Signed Static Application Data',
-    '94': 'Application File Locator (AFL)',
-    '95': 'Terminal Verification Results',
-    '97': 'Transaction Certificate Data Object List (TDOL)',
-    '98': 'Transaction Certificate (TC) Hash Value',
-    '99': 'Transaction Personal Identification Number (PIN) Data',
-    '9A': 'Transaction Date',
-    '9B': 'Transaction Status Information',
-    '9C': 'Transaction Type',
-    '9D': 'Directory Definition File (DDF) Name',
-    
-    # 9F Series Tags
-    '9F01': 'Acquirer Identifier',
-    '9F02': 'Amount, Authorized (Numeric)',
-    '9F03': 'Amount, Other (Numeric)',
-    '9F04': 'Amount, Other (Binary)',
-    '9F05': 'Application Discretionary Data',
-    '9F06': 'Application Identifier (AID) - Terminal',
-    '9F07': 'Application Usage Control',
-    '9F08': 'Application Version Number',
-    '9F09': 'Application Version Number - Terminal',
-    '9F0B': 'Cardholder Name Extended',
-    '9F0D': 'Issuer Action Code - Default',
-    '9F0E': 'Issuer Action Code - Denial',
-    '9F0F': 'Issuer Action Code - Online',
-    '9F10': 'Issuer Application Data',
-    '9F11': 'Issuer Code Table Index',
-    '9F12': 'Application Preferred Name',
-    '9F13': 'Last Online Application Transaction Counter (ATC) Register',
-    '9F14': 'Lower Consecutive Offline Limit',
-    '9F15': 'Merchant Category Code',
-    '9F16': 'Merchant Identifier',
-    '9F17': 'Personal Identification Number (PIN) Try Counter',
-    '9F18': 'Issuer Script Identifier',
-    '9F1A': 'Terminal Country Code',
-    '9F1B': 'Terminal Floor Limit',
-    '9F1C': 'Terminal Identification',
-    '9F1D': 'Terminal Risk Management Data',
-    '9F1E': 'Interface Device (IFD) Serial Number',
-    '9F1F': 'Track 1 Discretionary Data',
-    '9F20': 'Track 2 Discretionary Data',
-    '9F21': 'Transaction Time',
-    '9F22': 'Certification Authority Public Key Index - Terminal',
-    '9F23': 'Upper Consecutive Offline Limit',
-    '9F26': 'Application Cryptogram',
-    '9F27': 'Cryptogram Information Data',
-    '9F2D': 'ICC PIN Encipherment Public Key Certificate',
-    '9F2E': 'ICC PIN Encipherment Public Key Exponent',
-    '9F2F': 'ICC PIN Encipherment Public Key Remainder',
-    '9F32': 'Issuer Public Key Exponent',
-    '9F33': 'Terminal Capabilities',
-    '9F34': 'Cardholder Verification Method (CVM) Results',
-    '9F35': 'Terminal Type',
-    '9F36': 'Application Transaction Counter (ATC)',
-    '9F37': 'Unpredictable Number',
-    '9F38': 'Processing Options Data Object List (PDOL)',
-    '9F39': 'Point-of-Service (POS) Entry Mode',
-    '9F3A': 'Amount, Reference Currency',
-    '9F3B': 'Application Reference Currency',
-    '9F3C': 'Transaction Reference Currency Code',
-    '9F3D': 'Transaction Reference Currency Exponent',
-    '9F40': 'Additional Terminal Capabilities',
-    '9F41': 'Transaction Sequence Counter',
-    '9F42': 'Application Currency Code',
-    '9F43': 'Application Reference Currency Exponent',
-    '9F44': 'Application Currency Exponent',
-    '9F45': 'Data Authentication Code',
-    '9F46': 'ICC Public Key Certificate',
-    '9F47': 'ICC Public Key Exponent',
-    '9F48': 'ICC Public Key Remainder',
-    '9F49': 'Dynamic Data Authentication Data Object List (DDOL)',
-    '9F4A': 'Static Data Authentication Tag List',
-    '9F4B': 'Signed Dynamic Application Data',
-    '9F4C': 'ICC Dynamic Number',
-    '9F4D': 'Log Entry',
-    '9F4E': 'Merchant Name and Location',
-    '9F4F': 'Log Format',
-    '9F50': 'Offline Accumulator Balance',
-    '9F51': 'DRDOL Related Data',
-    '9F52': 'Terminal Compatibility Indicator',
-    '9F53': 'Consecutive Transaction Limit (International)',
-    '9F54': 'Cumulative Total Transaction Amount Limit',
-    '9F55': 'Geographic Indicator',
-    '9F56': 'Issuer Authentication Indicator',
-    '9F57': 'Issuer Country Code',
-    '9F58': 'Lower Consecutive Offline Limit (International)',
-    '9F59': 'Upper Consecutive Offline Limit (International)',
-    '9F5A': 'Issuer URL2',
-    '9F5B': 'Issuer Script Results',
-    '9F5C': 'Upper Cumulative Total Transaction Amount Limit',
-    '9F66': 'Terminal Transaction Qualifiers (TTQ)',
-    '9F6B': 'Track 2 Equivalent Data (Magnetic Stripe Data)',
-    '9F6C': 'Card Transaction Qualifiers (CTQ)',
-    '9F6E': 'Form Factor Indicator',
-    '9F72': 'Consecutive Transaction International Upper Limit',
-    '9F73': 'Currency Conversion Factor',
-    '9F74': 'VLP Issuer Authorization Code',
-    '9F75': 'Cumulative Total Transaction Amount Upper Limit',
-    '9F76': 'Secondary Application Currency Code',
-    '9F77': 'VLP Funds Limit',
-    '9F78': 'VLP Single Transaction Limit',
-    '9F79': 'VLP Available Funds',
-    '9F7A': 'VLP Single Transaction Limit',
-    '9F7B': 'VLP Transaction Qualifier',
-    '9F7C': 'Customer Exclusive Data',
-    '9F7D': 'Application Specific Transparent Template',
-    
-    # BF Series Tags
-    'BF0C': 'File Control Information (FCI) Issuer Discretionary Data',
-    
-    # Card Scheme Specific
-    'DF8104': 'Balance Read Before Gen AC',
-    'DF8105': 'Balance Read After Gen AC',
-    'DF8106': 'Data Needed',
-    'DF8107': 'CDOL1 Related Data',
-    'DF8108': 'DS AC Type',
-    'DF8109': 'DS Input (Term)',
-    'DF810A': 'DS ODS Info',
-    'DF810B': 'DS Summary 1',
-    'DF810C': 'DS Summary 2',
-    'DF810D': 'DS Summary 3',
-    'DF810E': 'DS Unpredictable Number',
-    'DF810F': 'Message Hold Time',
-    'DF8110': 'Phone Message Table',
-    'DF8111': 'Phone Response Code',
-    'DF8112': 'Script Hold Time',
-    'DF8113': 'Issuer Script Results',
-    'DF8114': 'Post-Gen AC Put Data Status',
-    'DF8115': 'Pre-Gen AC Put Data Status',
-    'DF8116': 'Proceed To First Write Flag',
-    'DF8117': 'PDOL Related Data',
-    'DF8118': 'Tags To Read',
-    'DF8119': 'Tags To Write Before Gen AC',
-    'DF811A': 'Tags To Write After Gen AC',
-    'DF811B': 'Data To Send',
-    'DF811C': 'Data Record',
-    'DF811D': 'Encryption Key',
-    'DF811E': 'Encrypted Data'
-}
+if not valid_log_level:
+    logger.warning("Unknown LOGLEVEL %r, falling back to INFO", log_level)
 
 SELECT_VISA_AID = [0x00, 0xA4, 0x04, 0x00, 0x07, 0xA0, 0x00, 0x00, 0x00, 0x03, 0x10, 0x10]
 SELECT_MASTERCARD_AID = [0x00, 0xA4, 0x04, 0x00, 0x07, 0xA0, 0x00, 0x00, 0x00, 0x04, 0x10, 0x10]
+SELECT_PPSE = [0x00, 0xA4, 0x04, 0x00, 0x0E] + list(b'2PAY.SYS.DDF01') + [0x00]
+CARD_TYPE_AIDS = (('Visa', SELECT_VISA_AID), ('Mastercard', SELECT_MASTERCARD_AID))  # Probe order
+IMAGE_DIR = Path(__file__).resolve().parent / 'images'
+CARD_TYPE_IMAGES = {'Visa': 'visa.png', 'Mastercard': 'mastercard.png'}  # Files in IMAGE_DIR
+CARD_TYPES_BY_RID = {
+    bytes.fromhex('A000000003'): 'Visa',
+    bytes.fromhex('A000000004'): 'Mastercard',
+    bytes.fromhex('A000000025'): 'American Express',
+}
 GET_PROCESSING_OPTIONS = [0x80, 0xA8, 0x00, 0x00, 0x02, 0x83, 0x00, 0x00]
+READ_RECORD_P2 = tuple((sfi << 3) | 0x04 for sfi in range(32))  # P2 for READ RECORD by SFI
+ATR_CACHE_SIZE = 32  # ATRs remembered for card type hints
+
+# Result of send_apdu; data is None when the card returned no response bytes
+ApduResponse = namedtuple('ApduResponse', ['data', 'sw1', 'sw2', 'success'])
+
+# Tag groups used when parsing and formatting TLV data
+TEMPLATE_TAGS = frozenset({'70', '77', '80', 'A5', '61', 'BF0C'})
+GROUPED_HEX_TAGS = frozenset({'5A', '57', '9F6B'})  # PAN and Track 2 data
+DOL_TAGS = frozenset({'8C', '8D'})  # CDOL1 and CDOL2
+RAW_VALUE_TAGS = frozenset({'9F07', '9F0D', '9F0E', '9F0F'})  # AUC and IACs
+HEX_DIGITS = frozenset('0123456789ABCDEF')
+
+# Raw tag bytes -> the hex key used by EMV_TAGS and the tag groups above
+EMV_TAG_KEYS = MappingProxyType({bytes.fromhex(tag): tag for tag in EMV_TAGS})
+
+# Descriptions that formatted records are keyed by, for the tags rendered as lists
+DOL_DESCRIPTIONS = frozenset(EMV_TAGS[tag] for tag in DOL_TAGS)
+CVM_LIST_DESCRIPTION = EMV_TAGS['8E']
+
+def build_select_apdu(aid):
+    """Build a SELECT by name APDU for the given AID bytes."""
+    return [0x00, 0xA4, 0x04, 0x00, len(aid)] + list(aid) + [0x00]
+
+def _iter_tlv(data):
+    """Yield (tag, value) for each top-level BER-TLV element in data.
+
+    Values are memoryview slices of one response buffer, so nested templates
+    are walked without copying. Stops quietly at the first truncated element.
+    """
+    buf = data if isinstance(data, memoryview) else memoryview(bytes(data))
+    n = len(buf)
+    i = 0
+    while i < n:
+        # Get tag
+        tag_start = i
+        first = buf[i]
+        i += 1
+
+        # Handle extended tag format (subsequent bytes follow while b8 is set)
+        if (first & 0x1F) == 0x1F:
+            while i < n and buf[i] & 0x80:
+                i += 1
+            i += 1
+        if i >= n:
+            return
+        raw_tag = buf[tag_start:i]
+        tag = EMV_TAG_KEYS.get(raw_tag) or raw_tag.hex().upper()
+
+        # Get length
+        length = buf[i]
+        i += 1
+
+        # Handle extended length format
+        if length & 0x80:
+            num_bytes = length & 0x7F
+            length = int.from_bytes(buf[i:i+num_bytes], 'big')
+            i += num_bytes
+
+        # Get value
+        if i + length > n:
+            return
+        yield tag, buf[i:i+length]
+        i += length
+
+def _format_grouped_hex(value_bytes):
+    """Format a value as hex in groups of 4 for readability."""
+    return value_bytes.hex(' ', -2).upper()
+
+def _format_raw_hex(value_bytes):
+    """Format a value as a plain hex string."""
+    return value_bytes.hex().upper()
+
+def _format_bcd_date(value_bytes, default_day):
+    """Format a YYMMDD BCD date with plain string slicing (no strptime)."""
+    value = value_bytes.hex()
+    day = value[4:6] if len(value) >= 6 and value[:6].isdigit() else default_day
+    return f"20{value[0:2]}-{value[2:4]}-{day}"
+
+def _format_expiration_date(value_bytes):
+    """Format an expiration date, defaulting to the last day of its month."""
+    return _format_bcd_date(value_bytes, '31')
+
+def _format_effective_date(value_bytes):
+    """Format an effective date, defaulting to the first day of its month."""
+    return _format_bcd_date(value_bytes, '01')
+
+def _format_dol(value_bytes):
+    """Split a CDOL into single-byte tag references."""
+    value = value_bytes.hex().upper()
+    return [value[j:j+2] for j in range(0, len(value), 2)]
+
+def _format_cvm_list(value_bytes):
+    """Split a Cardholder Verification Method list into 4-byte rules."""
+    value = value_bytes.hex().upper()
+    return [value[j:j+8] for j in range(0, len(value) - 7, 8)]
+
+# Value formatters for primitive tags that need more than the default hex output
+TLV_VALUE_FORMATTERS = {
+    **dict.fromkeys(GROUPED_HEX_TAGS, _format_grouped_hex),  # PAN or Track 2 data
+    **dict.fromkeys(RAW_VALUE_TAGS, _format_raw_hex),  # AUC and IAC (Default, Denial, Online)
+    **dict.fromkeys(DOL_TAGS, _format_dol),  # CDOL1 and CDOL2
+    '5F24': _format_expiration_date,
+    '5F25': _format_effective_date,
+    '8E': _format_cvm_list,
+}
+
+def _decode_tlv_value(tag, value_bytes):
+    """Format a primitive TLV value based on its tag.
+
+    Not cached: values include the PAN, track data and cardholder name,
+    which must not outlive the card read.
+    """
+    formatter = TLV_VALUE_FORMATTERS.get(tag)
+    if formatter:
+        return formatter(value_bytes)
+    # For other tags, if it's a long hex string, format it in groups of 4
+    if len(value_bytes) > 4:
+        return _format_grouped_hex(value_bytes)
+    return _format_raw_hex(value_bytes)
+
+def format_emv_records(emv_data):
+    """Render the records returned by read_card_data as display lines."""
+    lines = []
+    for record in emv_data:
+        if not isinstance(record, dict):
+            continue
+        if 'sfi' in record and 'record_number' in record:
+            lines.extend((f"\nSFI: {record['sfi']}, Record: {record['record_number']}", "-" * 50, "Record Template"))
+
+        for tag_desc, value in record.get('data', {}).items():
+            if not isinstance(value, list):
+                lines.append(f"  {tag_desc}: {value}")
+            elif tag_desc in DOL_DESCRIPTIONS:  # CDOL1 and CDOL2
+                lines.append(f"  {tag_desc}:")
+                lines.extend(f"    • {tag_name}" for tag_name in value)
+            elif tag_desc == CVM_LIST_DESCRIPTION:
+                lines.append(f"  {tag_desc}:")
+                lines.extend(f"    • Rule {i}: {rule}" for i, rule in enumerate(value, 1))
+            else:
+                lines.append(f"  {tag_desc}: {' '.join(value)}")
+    return lines
+
+class EmvReader:
+    """APDU exchange and EMV record decoding over a card connection.
+
+    Plain Python with no per-card state, so one instance can be shared by the
+    widgets and used from CardEventObserver's threads.
+    """
+    def parse_tlv(self, data):
+        """Parse BER-TLV data from raw response bytes.
+
+        Truncated input ends the parse early rather than raising.
+        """
+        result = {}
+        for tag, value in _iter_tlv(data):
+            # Handle template tags (70, 77, etc.) by recursively parsing their content
+            if tag in TEMPLATE_TAGS:
+                result[tag] = self.parse_tlv(value)
+            else:
+                result[tag] = _decode_tlv_value(tag, value.tobytes())
+
+        return result
+
+    def format_emv_data(self, tlv_data):
+        """Format EMV data with proper tag descriptions."""
+        formatted_data = {}
+        
+        if isinstance(tlv_data, dict):
+            for tag, value in tlv_data.items():
+                tag_desc = EMV_TAGS.get(tag, f"Unknown Tag ({tag})")
+                
+                if isinstance(value, dict):
+                    # For template tags, merge their contents into the current level
+                    if tag in TEMPLATE_TAGS:
+                        # This is a template, recursively parse its content
+                        inner_data = self.format_emv_data(value)
+                        formatted_data.update(inner_data)
+                    else:
+                        # This is a template, recursively format its content
+                        formatted_data[tag_desc] = self.format_emv_data(value)
+                elif isinstance(value, list):
+                    if tag in DOL_TAGS:  # CDOL1 and CDOL2
+                        # Convert tag list to EMV tag descriptions
+                        tag_list = []
+                        for t in value:
+                            tag_name = EMV_TAGS.get(t)
+                            if tag_name:  # Only add known tags
+                                tag_list.append(tag_name)
+                        formatted_data[tag_desc] = tag_list
+                    elif tag == '8E':  # CVM List
+                        formatted_data[tag_desc] = value
+                    else:
+                        formatted_data[tag_desc] = value
+                else:
+                    formatted_data[tag_desc] = value
+        
+        return formatted_data
+
+    def read_afl(self, connection):
+        """Send GET PROCESSING OPTIONS and return the AFL as (sfi, first, last) tuples."""
+        try:
+            response = self.send_apdu(connection, GET_PROCESSING_OPTIONS)
+            if not response.success or not response.data:
+                return []
+
+            templates = dict(_iter_tlv(response.data))
+            if '80' in templates:
+                # Format 1: AIP (2 bytes) followed directly by the AFL
+                afl = templates['80'][2:]
+            else:
+                # Format 2: AFL is tag 94 inside the response template
+                afl = dict(_iter_tlv(templates.get('77', b''))).get('94', b'')
+
+            # Each AFL entry is 4 bytes: SFI, first record, last record, offline auth count
+            return [(afl[j] >> 3, afl[j + 1], afl[j + 2]) for j in range(0, len(afl) - 3, 4)]
+
+        except Exception as e:
+            logger.error(f"Error reading AFL: {str(e)}")
+            return []
+
+    def read_card_data(self, connection, card_type):
+        """Read data from the card."""
+        try:
+            atr = connection.getATR()
+            
+            # Initialize result dictionary
+            result = {
+                'card_type': card_type,
+                'atr': atr,
+                'status': 'success',
+                'emv_data': []
+            }
+            
+            # Only read the records the card advertises in its AFL
+            afl_entries = self.read_afl(connection)
+            if not afl_entries:
+                # Fall back to scanning the most common SFIs for payment cards
+                afl_entries = [(sfi, 1, 16) for sfi in (1, 2)]
+            
+            # Read each SFI and its records
+            for sfi, first_record, last_record in afl_entries:
+                for record in range(first_record, last_record + 1):
+                    try:
+                        command = [0x00, 0xB2, record, READ_RECORD_P2[sfi], 0x00]
+                        data, sw1, sw2 = connection.transmit(command)
+                        
+                        if sw1 == 0x90 and sw2 == 0x00 and data:
+                            # Parse TLV data
+                            tlv_data = self.parse_tlv(data)
+                            
+                            if tlv_data:
+                                formatted_data = self.format_emv_data(tlv_data)
+                                if formatted_data:
+                                    result['emv_data'].append({
+                                        'sfi': sfi,
+                                        'record_number': record,
+                                        'data': formatted_data
+                                    })
+                            
+                        elif sw1 == 0x6A and sw2 == 0x83:  # Record not found
+                            break  # No more records in this SFI
+                            
+                    except Exception as e:
+                        if "Card is not present" not in str(e):
+                            logger.error(f"Error reading SFI {sfi}, record {record}: {str(e)}")
+                        continue
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error reading card data: {str(e)}")
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+
+    def read_ppse_aids(self, connection):
+        """Return the AIDs listed in the card's PPSE directory, in card order."""
+        response = self.send_apdu(connection, SELECT_PPSE)
+        if not response.success or not response.data:
+            return []
+
+        # FCI (6F) -> proprietary template (A5) -> issuer discretionary data (BF0C) -> entries (61)
+        fci = dict(_iter_tlv(response.data)).get('6F', b'')
+        proprietary = dict(_iter_tlv(fci)).get('A5', b'')
+        directory = dict(_iter_tlv(proprietary)).get('BF0C', b'')
+        aids = [dict(_iter_tlv(entry)).get('4F') for tag, entry in _iter_tlv(directory) if tag == '61']
+        return [aid.tobytes() for aid in aids if aid]
+
+    def detect_card_type(self, connection, expected_type=None):
+        """Detect the card brand and select its payment application.
+
+        When expected_type is given (e.g. from a previous read of the same ATR)
+        its AID is selected directly. Otherwise the PPSE directory is used,
+        falling back to probing the known Visa and Mastercard AIDs.
+        """
+        try:
+            if expected_type:
+                for card_type, select_apdu in CARD_TYPE_AIDS:
+                    if card_type == expected_type and self.send_apdu(connection, select_apdu).success:
+                        return card_type
+
+            # Let the card list its applications and map them to a brand by RID
+            for aid in self.read_ppse_aids(connection):
+                card_type = CARD_TYPES_BY_RID.get(aid[:5])
+                if card_type and self.send_apdu(connection, build_select_apdu(aid)).success:
+                    return card_type
+
+            # Fall back to probing the known AIDs
+            for card_type, select_apdu in CARD_TYPE_AIDS:
+                if self.send_apdu(connection, select_apdu).success:
+                    return card_type
+
+            return 'Unknown'
+        except Exception as e:
+            logger.error(f"Error detecting card type: {str(e)}")
+            return 'Unknown'
+
+    def send_apdu(self, connection, apdu):
+        """Send APDU command to card and return response."""
+        # Only the card I/O can raise; the status word handling below cannot
+        try:
+            response, sw1, sw2 = connection.transmit(apdu)
+
+            # Fetch the pending response (61 xx) or re-send with the Le the card asked for (6C xx)
+            if sw1 == 0x61:
+                apdu = [0x00, 0xC0, 0x00, 0x00, sw2]
+                response, sw1, sw2 = connection.transmit(apdu)
+            elif sw1 == 0x6C:
+                # Replace Le when the command carries one (cases 2 and 4), otherwise append it
+                has_le = len(apdu) == 5 or (len(apdu) > 5 and len(apdu) == 6 + apdu[4])
+                apdu = list(apdu[:-1] if has_le else apdu) + [sw2]
+                response, sw1, sw2 = connection.transmit(apdu)
+
+        except Exception as e:
+            logger.error(f"Error sending APDU: {str(e)}")
+            return ApduResponse(None, 0, 0, False)
+
+        # Log the last APDU sent and its response for debugging (skipped unless LOGLEVEL=DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            apdu_hex = bytes(apdu).hex(' ').upper()
+            resp_hex = bytes(response).hex(' ').upper() if response else 'None'
+            logger.debug("APDU Command: %s", apdu_hex)
+            logger.debug("Response: %s, SW1: %02X, SW2: %02X", resp_hex, sw1, sw2)
+        
+        # Create a response object
+        result = ApduResponse(response if response else None, sw1, sw2, sw1 == 0x90 or sw1 == 0x61)
+        
+        # Log any error conditions
+        if not result.success:
+            if sw1 == 0x6A:
+                if sw2 == 0x82:
+                    logger.error("File or application not found")
+                elif sw2 == 0x86:
+                    logger.error("Incorrect parameters P1-P2")
+                elif sw2 == 0x81:
+                    logger.error("Function not supported")
+                else:
+                    logger.error(f"Command failed with SW1=6A, SW2={sw2:02X}")
+            elif sw1 == 0x6D:
+                logger.error("Instruction code not supported")
+            elif sw1 == 0x6E:
+                logger.error("Class not supported")
+            elif sw1 == 0x6F:
+                logger.error("Command aborted")
+            else:
+                logger.error(f"Unexpected response: SW1={sw1:02X}, SW2={sw2:02X}")
+        
+        return result
 
 class CardReader(QWidget):
+    # Emitted from CardEventObserver's threads; delivered to the slots below on the GUI thread
+    card_read = pyqtSignal(dict)
+    card_removed = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.connection = None
+        self.connection_reader = None  # Reader holding the card behind self.connection
         self.reader = None
         self.card_type = None
-        self.last_atr = None
+        self.last_atr = None  # ATR of the card on display
         self.camera_widget = None  # Will hold our CameraWidget instance
+        self.card_pixmaps = {}  # Card type -> brand pixmap at its original size
+        self.scaled_card_pixmaps = {}  # Card type -> brand pixmap scaled to scaled_card_size
+        self.scaled_card_size = None
+        self.emv_reader = EmvReader()
+        self.card_read.connect(self.apply_card_data)
+        self.card_removed.connect(self.on_card_removed)
         self.init_ui()
         self.setup_card_reader()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.poll_card)
-        self.timer.start(1000)  # Poll every second
+
+        # Watch for cards for the widget's whole lifetime, not just while it is shown,
+        # so removals are never missed
+        self.card_monitor = CardMonitor()
+        self.card_observer = CardEventObserver(self.read_inserted_card, self.release_removed_card)
+        self.card_observer.attach(self.card_monitor)
 
     def setup_camera(self):
         """Initialize the camera using CameraWidget."""
@@ -304,10 +523,11 @@ class CardReader(QWidget):
         layout.addLayout(top_layout)
         
         # Card data display
-        self.card_info = QTextEdit()
+        self.card_info = QPlainTextEdit()
         self.card_info.setReadOnly(True)
+        self.card_info.setUndoRedoEnabled(False)
         self.card_info.setMinimumHeight(150)
-        self.card_info.setStyleSheet("QTextEdit { background-color: #f5f5f5; }")
+        self.card_info.setStyleSheet("QPlainTextEdit { background-color: #f5f5f5; }")
         layout.addWidget(self.card_info)
         
         self.setLayout(layout)
@@ -323,116 +543,141 @@ class CardReader(QWidget):
 
     def update_card_image(self):
         """Update the card image based on detected card type."""
-        if self.card_type == "Visa" and hasattr(self, 'visa_image'):
-            pixmap = QPixmap.fromImage(self.visa_image)
-        elif self.card_type == "Mastercard" and hasattr(self, 'mastercard_image'):
-            pixmap = QPixmap.fromImage(self.mastercard_image)
-        else:
-            return
-
-        if not pixmap.isNull():
-            # Scale the pixmap to fit the label while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(self.card_image_label.size(), 
-                                        Qt.AspectRatioMode.KeepAspectRatio,
-                                        Qt.TransformationMode.SmoothTransformation)
-            self.card_image_label.setPixmap(scaled_pixmap)
-            self.card_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-    def poll_card(self):
-        """Poll for card presence and read data if card is present."""
-        try:
-            connection = self.reader.createConnection()
-            if not connection.connect():
-                self.connection = None
-                self.card_type = None
-                self.last_atr = None
-                self.status_label.setText("Waiting for card...")
+        # Scaled pixmaps are reused until the label changes size
+        size = self.card_image_label.size()
+        if size != self.scaled_card_size:
+            self.scaled_card_pixmaps = {}
+            self.scaled_card_size = size
+
+        pixmap = self.scaled_card_pixmaps.get(self.card_type)
+        if pixmap is None:
+            source = self.card_pixmaps.get(self.card_type)
+            if source is None:
                 self.card_image_label.clear()
-                self.card_info.setPlainText("No card present")
                 return
+            # Scale the pixmap to fit the label while maintaining aspect ratio
+            pixmap = source.scaled(size,
+                                   Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+            self.scaled_card_pixmaps[self.card_type] = pixmap
+
+        self.card_image_label.setPixmap(pixmap)
+
+    def release_connection(self, connection):
+        """Disconnect a card connection, ignoring cards that are already gone."""
+        try:
+            connection.disconnect()
+        except Exception as e:
+            logger.debug("Error disconnecting card: %s", e)
+
+    def release_removed_card(self, card):
+        """Drop the connection to a removed card (called off the GUI thread by CardEventObserver)."""
+        if self.connection_reader is not None and card.reader != self.connection_reader:
+            return  # A card on another reader; the one on display is still present
+        if self.connection is not None:
+            self.release_connection(self.connection)
+        self.connection = None
+        self.connection_reader = None
+        self.last_atr = None
+        self.card_removed.emit(card)
+
+    def closeEvent(self, event):
+        """Stop watching for cards and release the connection still held."""
+        self.card_monitor.deleteObserver(self.card_observer)
+        with self.card_observer.lock:  # Let a read already in progress finish first
+            if self.connection is not None:
+                self.release_connection(self.connection)
+            self.connection = None
+            self.connection_reader = None
+            self.last_atr = None
+        super().closeEvent(event)
+
+    def on_card_removed(self, card):
+        """Reset the display when the card is taken off the reader."""
+        self.card_type = None
+        self.status_label.setText("Waiting for card...")
+        self.card_image_label.clear()
+        self.card_info.setPlainText("No card present")
+
+    def read_inserted_card(self, card):
+        """Read a newly inserted card (called off the GUI thread by CardEventObserver).
+
+        All PC/SC traffic stays off the GUI thread; the outcome is emitted through
+        card_read for apply_card_data to show there.
+        """
+        connection = None
+        try:
+            connection = card.createConnection()
+            connection.connect()
 
             # Get ATR
             atr = connection.getATR()
-            if atr != self.last_atr:
-                logger.debug(f"New card detected with ATR: {' '.join([f'{b:02X}' for b in atr])}")
-                self.last_atr = atr
-                self.connection = connection
-
-                # Detect card type
-                self.card_type = self.detect_card_type(connection)
-                if not self.card_type:
-                    self.status_label.setText("Unknown card type")
-                    self.card_info.setPlainText("Unknown card type")
-                    return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("New card detected with ATR: %s", bytes(atr).hex(' ').upper())
+            if self.connection is not None:
+                self.release_connection(self.connection)  # Superseded by the newly inserted card
+            self.last_atr = atr
+            self.connection = connection
+            self.connection_reader = card.reader
+
+            # Detect card type
+            card_type = self.emv_reader.detect_card_type(connection)
+            if not card_type:
+                self.card_read.emit({'card_type': None, 'status': "Unknown card type", 'info': "Unknown card type"})
+                return
 
-                self.status_label.setText(f"{self.card_type} card detected")
-                self.update_card_image()
+            status = f"{card_type} card detected"
 
-                # Read EMV data
-                try:
-                    card_data = self.read_card_data(connection, self.card_type)
-                    if not isinstance(card_data, dict):
-                        logger.error("Card data is not a dictionary")
-                        self.card_info.setPlainText(f"Invalid card data format: {str(card_data)}")
-                        return
+            # Read EMV data
+            try:
+                card_data = self.emv_reader.read_card_data(connection, card_type)
+                if not isinstance(card_data, dict):
+                    logger.error("Card data is not a dictionary")
+                    self.card_read.emit({'card_type': card_type, 'status': status,
+                                         'info': f"Invalid card data format: {str(card_data)}"})
+                    return
 
-                    if card_data.get('status') != 'success':
-                        self.card_info.setPlainText(f"Error reading card: {card_data.get('status', 'Unknown error')}")
-                        return
+                if card_data.get('status') != 'success':
+                    self.card_read.emit({'card_type': card_type, 'status': status,
+                                         'info': f"Error reading card: {card_data.get('status', 'Unknown error')}"})
+                    return
 
-                    # Format the data
-                    output = []
-                    output.append("Card Information:")
-                    output.append(f"Card Type: {card_data.get('card_type', 'Unknown').upper()}")
-                    
-                    if card_data.get('atr'):
-                        atr_str = ' '.join([f'{b:02X}' for b in card_data['atr']])
-                        output.append(f"ATR: {atr_str}")
+                # Format the data
+                output = []
+                output.append("Card Information:")
+                output.append(f"Card Type: {card_data.get('card_type', 'Unknown').upper()}")
+                
+                if card_data.get('atr'):
+                    atr_str = bytes(card_data['atr']).hex(' ').upper()
+                    output.append(f"ATR: {atr_str}")
 
-                    output.append("\n=== EMV Card Data ===")
+                output.append("\n=== EMV Card Data ===")
 
-                    if card_data.get('emv_data'):
-                        for record in card_data['emv_data']:
-                            if isinstance(record, dict):
-                                if 'sfi' in record and 'record_number' in record:
-                                    output.append(f"\nSFI: {record['sfi']}, Record: {record['record_number']}")
-                                    output.append("-" * 50)
-                                    output.append("Record Template")
-                                    
-                                if 'data' in record:
-                                    for tag_desc, value in record['data'].items():
-                                        if tag_desc.startswith("Card Risk Management Data Object List"):  # CDOL1 and CDOL2
-                                            output.append(f"  {tag_desc}:")
-                                            cdol_tags = value.split()
-                                            for cdol_tag in cdol_tags:
-                                                if cdol_tag in EMV_TAGS:
-                                                    output.append(f"    • {EMV_TAGS[cdol_tag]}")
-                                        elif tag_desc.startswith("Cardholder Verification Method (CVM) List"):
-                                            output.append(f"  {tag_desc}:")
-                                            cvm_rules = value.split()
-                                            for i, rule in enumerate(cvm_rules, 1):
-                                                output.append(f"    • Rule {i}: {rule}")
-                                        else:
-                                            # Format long hex strings
-                                            if isinstance(value, str) and len(value) > 20 and all(c in '0123456789ABCDEF' for c in value):
-                                                formatted_value = ' '.join(value[i:i+4] for i in range(0, len(value), 4))
-                                            else:
-                                                formatted_value = value
-                                            output.append(f"  {tag_desc}: {formatted_value}")
+                output.extend(format_emv_records(card_data.get('emv_data', ())))
 
-                    self.card_info.setPlainText('\n'.join(output))
+                self.card_read.emit({'card_type': card_type, 'status': status, 'info': '\n'.join(output)})
 
-                except Exception as e:
-                    logger.error(f"Error processing card data: {str(e)}")
-                    self.card_info.setPlainText(f"Error processing card: {str(e)}")
+            except Exception as e:
+                logger.error(f"Error processing card data: {str(e)}")
+                self.card_read.emit({'card_type': card_type, 'status': status,
+                                     'info': f"Error processing card: {str(e)}"})
 
         except Exception as e:
-            logger.error(f"Error in card polling: {str(e)}")
-            self.connection = None
-            self.card_type = None
+            logger.error(f"Error reading inserted card: {str(e)}")
+            if connection is not None:
+                self.release_connection(connection)
+                if connection is self.connection:
+                    self.connection = None
+                    self.connection_reader = None
             self.last_atr = None
-            self.status_label.setText("Error reading card")
-            self.card_info.setPlainText(f"Error: {str(e)}")
+            self.card_read.emit({'card_type': None, 'status': "Error reading card", 'info': f"Error: {str(e)}"})
+
+    def apply_card_data(self, result):
+        """Show the outcome of a card read in the widgets."""
+        self.card_type = result['card_type']
+        self.status_label.setText(result['status'])
+        self.update_card_image()
+        self.card_info.setPlainText(result['info'])
 
     def setup_card_reader(self):
         """Initialize the card reader."""
@@ -444,12 +689,14 @@ class CardReader(QWidget):
                 return
 
             self.reader = available_readers[0]
-            logger.debug(f"Using reader: {self.reader}")
+            logger.debug("Using reader: %s", self.reader)
             self.status_label.setText(f"Using reader: {self.reader}")
             
-            # Load card type images
-            self.visa_image = self.load_card_image("visa.png")
-            self.mastercard_image = self.load_card_image("mastercard.png")
+            # Load card type images, converting them to pixmaps once
+            for card_type, image_name in CARD_TYPE_IMAGES.items():
+                image = self.load_card_image(image_name)
+                if image is not None:
+                    self.card_pixmaps[card_type] = QPixmap.fromImage(image)
             
             # Initialize camera after card reader is set up
             self.setup_camera()
@@ -461,273 +708,38 @@ class CardReader(QWidget):
     def load_card_image(self, image_name):
         """Load a card type image."""
         try:
-            image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", image_name)
-            logger.debug(f"Loading {image_name.split('.')[0].title()} image from: {image_path}")
+            image_path = IMAGE_DIR / image_name
+            logger.debug("Loading %s image from: %s", image_path.stem.title(), image_path)
             
-            if not os.path.exists(image_path):
+            if not image_path.exists():
                 logger.error(f"Image file not found: {image_path}")
                 return None
                 
-            image = QImage(image_path)
+            image = QImage(str(image_path))
             if image.isNull():
                 logger.error(f"Failed to load image: {image_path}")
                 return None
+
+            # Store in a pixmap-native format so QPixmap.fromImage is a straight copy
+            # (the bundled PNGs are palette images, which would otherwise be expanded)
+            if image.hasAlphaChannel():
+                image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            else:
+                image = image.convertToFormat(QImage.Format.Format_RGB32)
                 
-            logger.debug(f"Loaded {image_name.split('.')[0].title()} image successfully")
+            logger.debug("Loaded %s image successfully", image_path.stem.title())
             return image
             
         except Exception as e:
             logger.error(f"Error loading {image_name}: {str(e)}")
             return None
 
-    def parse_tlv(self, hex_str):
-        """Parse TLV data from hex string."""
-        try:
-            result = {}
-            i = 0
-            while i < len(hex_str):
-                # Get tag
-                tag = hex_str[i:i+2]
-                i += 2
-                if i >= len(hex_str):
-                    break
-
-                # Handle extended tag format
-                while (int(tag, 16) & 0x1F) == 0x1F and i < len(hex_str):
-                    tag += hex_str[i:i+2]
-                    i += 2
-                    if i >= len(hex_str):
-                        break
-
-                # Get length
-                length = int(hex_str[i:i+2], 16)
-                i += 2
-                if i >= len(hex_str):
-                    break
-
-                # Handle extended length format
-                if length > 128:
-                    num_bytes = length - 128
-                    length = int(hex_str[i:i+num_bytes*2], 16)
-                    i += num_bytes * 2
-
-                # Get value
-                if i + length * 2 > len(hex_str):
-                    break
-                value = hex_str[i:i+length*2]
-                i += length * 2
-
-                # Handle template tags (70, 77, etc.) by recursively parsing their content
-                if tag in ['70', '77', '80', 'A5', '61', 'BF0C']:
-                    # This is a template, recursively parse its content
-                    nested_data = self.parse_tlv(value)
-                    result[tag] = nested_data
-                else:
-                    # Format the value based on tag type
-                    if tag in ['5A', '57', '9F6B']:  # PAN or Track 2 data
-                        # Format in groups of 4 for readability
-                        decoded = ' '.join([value[j:j+4] for j in range(0, len(value), 4)])
-                        result[tag] = decoded
-                    elif tag in ['5F24']:  # Expiration Date
-                        year = '20' + value[0:2]
-                        month = value[2:4]
-                        result[tag] = f"{year}-{month}-31"
-                    elif tag in ['5F25']:  # Effective Date
-                        year = '20' + value[0:2]
-                        month = value[2:4]
-                        result[tag] = f"{year}-{month}-01"
-                    elif tag in ['9F07']:  # Application Usage Control
-                        result[tag] = value
-                    elif tag in ['8C', '8D']:  # CDOL1 and CDOL2
-                        # Parse as a list of tag references
-                        cdol_tags = [value[j:j+2] for j in range(0, len(value), 2)]
-                        result[tag] = cdol_tags
-                    elif tag in ['8E']:  # CVM List
-                        # Parse Cardholder Verification Method list
-                        cvm_rules = []
-                        j = 0
-                        while j < len(value):
-                            if j + 8 <= len(value):
-                                rule = value[j:j+8]
-                                cvm_rules.append(rule)
-                            j += 8
-                        result[tag] = cvm_rules
-                    elif tag in ['9F0D', '9F0E', '9F0F']:  # IAC (Default, Denial, Online)
-                        result[tag] = value
-                    else:
-                        # For other tags, if it's a long hex string, format it in groups of 4
-                        if len(value) > 8:
-                            result[tag] = ' '.join([value[j:j+4] for j in range(0, len(value), 4)])
-                        else:
-                            result[tag] = value
-
-            return result
-        except Exception as e:
-            logger.error(f"Error parsing TLV data: {str(e)}")
-            return {}
-
-    def format_emv_data(self, tlv_data):
-        """Format EMV data with proper tag descriptions."""
-        formatted_data = {}
-        
-        if isinstance(tlv_data, dict):
-            for tag, value in tlv_data.items():
-                tag_desc = EMV_TAGS.get(tag, f"Unknown Tag ({tag})")
-                
-                if isinstance(value, dict):
-                    # For template tags, merge their contents into the current level
-                    if tag in ['70', '77', '80', 'A5', '61', 'BF0C']:
-                        # This is a template, recursively parse its content
-                        inner_data = self.format_emv_data(value)
-                        formatted_data.update(inner_data)
-                    else:
-                        # This is a template, recursively format its content
-                        formatted_data[tag_desc] = self.format_emv_data(value)
-                elif isinstance(value, list):
-                    if tag in ['8C', '8D']:  # CDOL1 and CDOL2
-                        # Convert tag list to EMV tag descriptions
-                        tag_list = []
-                        for t in value:
-                            tag_name = EMV_TAGS.get(t)
-                            if tag_name:  # Only add known tags
-                                tag_list.append(tag_name)
-                        formatted_data[tag_desc] = tag_list
-                    elif tag == '8E':  # CVM List
-                        formatted_data[tag_desc] = value
-                    else:
-                        formatted_data[tag_desc] = value
-                else:
-                    formatted_data[tag_desc] = value
-        
-        return formatted_data
-
-    def read_card_data(self, connection, card_type):
-        """Read data from the card."""
-        try:
-            atr = connection.getATR()
-            
-            # Initialize result dictionary
-            result = {
-                'card_type': card_type,
-                'atr': atr,
-                'status': 'success',
-                'emv_data': []
-            }
-            
-            # Common SFIs that typically contain useful data
-            priority_sfis = [1, 2]  # Most common SFIs for payment cards
-            
-            # Read each SFI and its records
-            for sfi in priority_sfis:
-                for record in range(1, 17):  # Try up to 16 records per SFI
-                    try:
-                        command = [0x00, 0xB2, record, (sfi << 3) | 0x04, 0x00]
-                        data, sw1, sw2 = connection.transmit(command)
-                        
-                        if sw1 == 0x90 and sw2 == 0x00 and data:
-                            # Parse TLV data
-                            hex_data = toHexString(data).replace(' ', '')
-                            tlv_data = self.parse_tlv(hex_data)
-                            
-                            if tlv_data:
-                                formatted_data = self.format_emv_data(tlv_data)
-                                if formatted_data:
-                                    result['emv_data'].append({
-                                        'sfi': sfi,
-                                        'record_number': record,
-                                        'data': formatted_data
-                                    })
-                            
-                        elif sw1 == 0x6A and sw2 == 0x83:  # Record not found
-                            break  # No more records in this SFI
-                            
-                    except Exception as e:
-                        if "Card is not present" not in str(e):
-                            logger.error(f"Error reading SFI {sfi}, record {record}: {str(e)}")
-                        continue
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error reading card data: {str(e)}")
-            return {
-                'status': 'error',
-                'message': str(e)
-            }
-
-    def detect_card_type(self, connection):
-        """Detect if card is Visa or Mastercard."""
-        try:
-            # Try Visa AID
-            response = self.send_apdu(connection, SELECT_VISA_AID)
-            if response and response['success']:
-                return 'Visa'
-
-            # Try Mastercard AID
-            response = self.send_apdu(connection, SELECT_MASTERCARD_AID)
-            if response and response['success']:
-                return 'Mastercard'
-
-            return 'Unknown'
-        except Exception as e:
-            logger.error(f"Error detecting card type: {str(e)}")
-            return 'Unknown'
-
-    def send_apdu(self, connection, apdu):
-        """Send APDU command to card and return response."""
-        try:
-            response, sw1, sw2 = connection.transmit(apdu)
-            
-            # Log the APDU command and response for debugging
-            apdu_hex = ' '.join([f'{b:02X}' for b in apdu])
-            resp_hex = ' '.join([f'{b:02X}' for b in response]) if response else 'None'
-            logger.debug(f"APDU Command: {apdu_hex}")
-            logger.debug(f"Response: {resp_hex}, SW1: {sw1:02X}, SW2: {sw2:02X}")
-            
-            # Create a response object
-            result = {
-                'data': response if response else None,
-                'sw1': sw1,
-                'sw2': sw2,
-                'success': sw1 == 0x90 or sw1 == 0x61
-            }
-            
-            # Log any error conditions
-            if not result['success']:
-                if sw1 == 0x6A:
-                    if sw2 == 0x82:
-                        logger.error("File or application not found")
-                    elif sw2 == 0x86:
-                        logger.error("Incorrect parameters P1-P2")
-                    elif sw2 == 0x81:
-                        logger.error("Function not supported")
-                    else:
-                        logger.error(f"Command failed with SW1=6A, SW2={sw2:02X}")
-                elif sw1 == 0x6D:
-                    logger.error("Instruction code not supported")
-                elif sw1 == 0x6E:
-                    logger.error("Class not supported")
-                elif sw1 == 0x6F:
-                    logger.error("Command aborted")
-                else:
-                    logger.error(f"Unexpected response: SW1={sw1:02X}, SW2={sw2:02X}")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error sending APDU: {str(e)}")
-            return {
-                'data': None,
-                'sw1': 0,
-                'sw2': 0,
-                'success': False
-            }
-
 class CardDataDisplay(QWidget):
     """Widget to display card data in a structured format."""
     
     def __init__(self):
         super().__init__()
+        self.displayed_text = None  # Text currently shown in card_info
         self.init_ui()
         
     def init_ui(self):
@@ -735,8 +747,9 @@ class CardDataDisplay(QWidget):
         layout = QVBoxLayout()
         
         # Create text display
-        self.card_info = QTextEdit()
+        self.card_info = QPlainTextEdit()
         self.card_info.setReadOnly(True)
+        self.card_info.setUndoRedoEnabled(False)
         self.card_info.setMinimumSize(400, 300)
         layout.addWidget(self.card_info)
         
@@ -748,19 +761,25 @@ class CardDataDisplay(QWidget):
         
         self.setLayout(layout)
         
+    def set_card_info(self, text):
+        """Show text in card_info, skipping the relayout when it is already shown."""
+        if text != self.displayed_text:
+            self.card_info.setPlainText(text)
+            self.displayed_text = text
+
     def update_display(self, card_data):
         """Update the display with formatted card data."""
         try:
-            logger.debug(f"Updating display with card data: {card_data}")
+            logger.debug("Updating display with card data: %s", card_data)
             
             if isinstance(card_data, str):
-                self.card_info.setPlainText(card_data)
+                self.set_card_info(card_data)
                 self.print_button.setEnabled(True)
                 return
                 
             # Handle None or empty data
             if not card_data:
-                self.card_info.setPlainText("No card data available")
+                self.set_card_info("No card data available")
                 self.print_button.setEnabled(False)
                 return
 
@@ -771,7 +790,7 @@ class CardDataDisplay(QWidget):
             if 'card_type' in card_data:
                 output.append(f"Card Type: {card_data['card_type'].upper()}")
             if 'atr' in card_data:
-                atr_str = ' '.join([f'{b:02X}' for b in card_data['atr']])
+                atr_str = bytes(card_data['atr']).hex(' ').upper()
                 output.append(f"ATR: {atr_str}")
             
             output.append("\n=== EMV Card Data ===")
@@ -792,12 +811,13 @@ class CardDataDisplay(QWidget):
                                 if isinstance(value, dict) and 'decoded' in value:
                                     decoded_value = value['decoded']
                                     
-                                    if tag in ['8C', '8D']:  # CDOL1 and CDOL2
+                                    if tag in DOL_TAGS:  # CDOL1 and CDOL2
                                         output.append(f"  {tag_desc}:")
                                         cdol_tags = [decoded_value[i:i+2] for i in range(0, len(decoded_value), 2)]
                                         for cdol_tag in cdol_tags:
-                                            if cdol_tag in EMV_TAGS:
-                                                output.append(f"    • {EMV_TAGS[cdol_tag]}")
+                                            tag_name = EMV_TAGS.get(cdol_tag)
+                                            if tag_name:
+                                                output.append(f"    • {tag_name}")
                                     elif tag == '8E':  # CVM List
                                         output.append(f"  {tag_desc}:")
                                         cvm_rules = decoded_value.split()
@@ -805,27 +825,27 @@ class CardDataDisplay(QWidget):
                                             output.append(f"    • Rule {i}: {rule}")
                                     else:
                                         # Format long hex strings
-                                        if len(decoded_value) > 20 and all(c in '0123456789ABCDEF' for c in decoded_value):
+                                        if len(decoded_value) > 20 and HEX_DIGITS.issuperset(decoded_value):
                                             formatted_value = ' '.join(decoded_value[i:i+4] for i in range(0, len(decoded_value), 4))
                                         else:
                                             formatted_value = decoded_value
                                         output.append(f"  {tag_desc}: {formatted_value}")
                                 else:
                                     # Format long hex strings
-                                    if isinstance(value, str) and len(value) > 20 and all(c in '0123456789ABCDEF' for c in value):
+                                    if isinstance(value, str) and len(value) > 20 and HEX_DIGITS.issuperset(value):
                                         formatted_value = ' '.join(value[i:i+4] for i in range(0, len(value), 4))
                                     else:
                                         formatted_value = value
                                     output.append(f"  {tag_desc}: {formatted_value}")
             
             formatted_output = '\n'.join(output)
-            self.card_info.setPlainText(formatted_output)
+            self.set_card_info(formatted_output)
             self.print_button.setEnabled(True)
             
         except Exception as e:
             error_msg = f"Error displaying card data: {str(e)}"
             logger.error(error_msg)
-            self.card_info.setPlainText(error_msg)
+            self.set_card_info(error_msg)
             self.print_button.setEnabled(False)
     
     def print_data(self):
@@ -940,7 +960,7 @@ class CameraWidget(QWidget):
                                 logger.info(f"Found camera at index {i} using DirectShow")
                         cap.release()
                     except Exception as e:
-                        logger.debug(f"Error checking Windows camera {i}: {str(e)}")
+                        logger.debug("Error checking Windows camera %d: %s", i, e)
             else:
                 # On Linux, check specific video devices
                 v4l2_devices = glob.glob('/dev/video*')
@@ -981,7 +1001,7 @@ class CameraWidget(QWidget):
                                 logger.info(f"Found working camera at {device}")
                             cap.release()
                     except Exception as e:
-                        logger.debug(f"Error checking Linux camera {device}: {str(e)}")
+                        logger.debug("Error checking Linux camera %s: %s", device, e)
             
             if not self.available_cameras:
                 error_msg = "No working cameras found!"
@@ -1179,43 +1199,66 @@ class CameraWidget(QWidget):
         self.stop_camera()
         super().closeEvent(event)
 
+class CardEventObserver(CardObserver):
+    """Forward card insertions and removals reported by pyscard's CardMonitor to callbacks."""
+    def __init__(self, on_card_inserted, on_card_removed):
+        super().__init__()
+        self.on_card_inserted = on_card_inserted
+        self.on_card_removed = on_card_removed
+        self.lock = threading.Lock()  # Serialises the present-card replay with monitor events
+
+    def attach(self, card_monitor):
+        """Register with card_monitor without running card I/O on the calling thread.
+
+        addObserver reports the cards already present by calling update before it
+        returns, so it is run on a short-lived worker thread instead.
+        """
+        threading.Thread(target=card_monitor.addObserver, args=(self,), daemon=True).start()
+
+    def update(self, observable, actions):
+        added_cards, removed_cards = actions
+        with self.lock:
+            for card in removed_cards:
+                self.on_card_removed(card)
+            for card in added_cards:
+                self.on_card_inserted(card)
+
 class CardReaderApp(QMainWindow):
+    # Emitted from CardEventObserver's threads; connected to the widgets in init_ui
+    card_detected = pyqtSignal(str)
+    card_info_changed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
+        self._atr_card_types = OrderedDict()  # ATR -> card type seen on an earlier read, oldest first
+        self.card_images = {}  # Card type -> pre-scaled brand pixmap
+        self.connections = {}  # Reader name -> connection to the card currently inserted
+        self.emv_reader = EmvReader()  # APDU and EMV decoding helpers
         self.init_ui()
-        self.start_card_polling()
+        # Images first: cards already on a reader are reported as soon as monitoring starts
         self.load_card_images()
+        self.start_card_polling()
 
     def load_card_images(self):
-        """Load card brand images."""
+        """Load card brand images, pre-scaled for the display's pixel ratio."""
         try:
-            # Get the directory where the script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            images_dir = os.path.join(script_dir, 'images')
+            pixel_ratio = self.devicePixelRatioF()
             
-            # Load Visa image
-            visa_path = os.path.join(images_dir, 'visa.png')
-            logger.debug(f"Loading Visa image from: {visa_path}")
-            self.visa_pixmap = QPixmap(visa_path)
-            if self.visa_pixmap.isNull():
-                logger.error(f"Failed to load Visa image from {visa_path}")
-            else:
-                self.visa_pixmap = self.visa_pixmap.scaled(400, 250, 
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation)
-                logger.debug(f"Loaded Visa image successfully")
-            
-            # Load Mastercard image
-            mastercard_path = os.path.join(images_dir, 'mastercard.png')
-            logger.debug(f"Loading Mastercard image from: {mastercard_path}")
-            self.mastercard_pixmap = QPixmap(mastercard_path)
-            if self.mastercard_pixmap.isNull():
-                logger.error(f"Failed to load Mastercard image from {mastercard_path}")
-            else:
-                self.mastercard_pixmap = self.mastercard_pixmap.scaled(400, 250,
+            for card_type, image_name in CARD_TYPE_IMAGES.items():
+                image_path = IMAGE_DIR / image_name
+                logger.debug("Loading %s image from: %s", card_type, image_path)
+                pixmap = QPixmap(str(image_path))
+                if pixmap.isNull():
+                    logger.error(f"Failed to load {card_type} image from {image_path}")
+                    continue
+
+                # Scale to device pixels so setPixmap never needs to resample on HiDPI screens
+                pixmap = pixmap.scaled(int(400 * pixel_ratio), int(250 * pixel_ratio),
                     Qt.AspectRatioMode.KeepAspectRatio,
                     Qt.TransformationMode.SmoothTransformation)
-                logger.debug(f"Loaded Mastercard image successfully")
+                pixmap.setDevicePixelRatio(pixel_ratio)
+                self.card_images[card_type] = pixmap
+                logger.debug("Loaded %s image successfully", card_type)
             
         except Exception as e:
             logger.error(f"Error loading card images: {str(e)}", exc_info=True)
@@ -1261,165 +1304,139 @@ class CardReaderApp(QMainWindow):
             top_row.setStretchFactor(self.card_image, 1)
 
             # Second row: Status logging
-            self.status_text = QTextEdit()
-            self.status_text.setReadOnly(True)
+            self.status_text = QLabel()
+            self.status_text.setTextFormat(Qt.TextFormat.PlainText)
+            self.status_text.setWordWrap(True)
+            self.status_text.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
             self.status_text.setFixedHeight(100)
-            self.status_text.setStyleSheet("QTextEdit { background-color: #f5f5f5; }")
+            self.status_text.setStyleSheet("QLabel { background-color: #f5f5f5; }")
 
             # Third row: Card info
-            self.card_info = QTextEdit()
+            self.card_info = QPlainTextEdit()
             self.card_info.setReadOnly(True)
+            self.card_info.setUndoRedoEnabled(False)  # Text is only ever replaced wholesale
             self.card_info.setMinimumHeight(150)
-            self.card_info.setStyleSheet("QTextEdit { background-color: #f5f5f5; }")
+            self.card_info.setStyleSheet("QPlainTextEdit { background-color: #f5f5f5; }")
+            self.card_info.setMaximumBlockCount(2000)  # Bound memory for pathological cards
 
             # Add all rows to main layout
             main_layout.addLayout(top_row)
             main_layout.addWidget(self.status_text)
             main_layout.addWidget(self.card_info)
+
+            # Route updates from the card observer threads to the widgets
+            self.card_detected.connect(self.show_card_detected)
+            self.card_info_changed.connect(self.card_info.setPlainText)
             
         except Exception as e:
             logger.error(f"Error initializing UI: {str(e)}", exc_info=True)
 
+    def show_card_detected(self, card_type):
+        """Show the reading status and brand image for a detected card in one repaint."""
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        self.status_text.setText('Reading card data... Please hold the card')
+        pixmap = self.card_images.get(card_type)
+        if pixmap:
+            self.card_image.setPixmap(pixmap)
+        else:
+            self.card_image.clear()  # No logo for this brand; don't leave the previous card's up
+        central_widget.setUpdatesEnabled(True)
+
     def start_card_polling(self):
-        """Start the card polling thread."""
-        self.poll_thread = threading.Thread(target=self.poll_cards, daemon=True)
-        self.poll_thread.start()
+        """Start watching the readers for card insertions."""
+        self.card_monitor = CardMonitor()
+        self.card_observer = CardEventObserver(self.handle_card, self.handle_card_removed)
+        self.card_observer.attach(self.card_monitor)
+
+    def handle_card_removed(self, card):
+        """Release the connection held for a removed card."""
+        connection = self.connections.pop(card.reader, None)
+        if connection is not None:
+            try:
+                connection.disconnect()
+            except Exception as e:
+                logger.debug("Error disconnecting removed card: %s", e)
+
+    def closeEvent(self, event):
+        """Stop watching for cards and release the connections still held."""
+        self.card_monitor.deleteObserver(self.card_observer)
+        while self.connections:
+            reader, connection = self.connections.popitem()
+            try:
+                connection.disconnect()
+            except Exception as e:
+                logger.debug("Error disconnecting card in %s: %s", reader, e)
+        super().closeEvent(event)
 
-    def poll_cards(self):
-        """Poll for card presence and read card data."""
+    def handle_card(self, card):
+        """Read and display a newly inserted card (called off the GUI thread by CardEventObserver)."""
         try:
-            while True:
+            # Keep one connection per insertion; it is released when the card is removed
+            connection = card.createConnection()
+            connection.connect()
+            self.connections[card.reader] = connection
+
+            current_atr = bytes(connection.getATR()).hex(' ').upper()
+            logger.debug("New card detected with ATR: %s", current_atr)
+            
+            # Detect card type, trying the type last seen with this ATR first
+            card_type = self.emv_reader.detect_card_type(connection, self._atr_card_types.get(current_atr))
+            if card_type != 'Unknown':
+                self._atr_card_types[current_atr] = card_type
+                self._atr_card_types.move_to_end(current_atr)
+                if len(self._atr_card_types) > ATR_CACHE_SIZE:
+                    self._atr_card_types.popitem(last=False)
+            
+            # Update status and card image (signals are queued to the GUI thread)
+            if card_type:
+                self.card_detected.emit(card_type)
+                
+                # Read and decode card data
                 try:
-                    # Get available readers
-                    available_readers = readers()
+                    card_data = self.emv_reader.read_card_data(connection, card_type)
+                    if not isinstance(card_data, dict):
+                        logger.error("Card data is not a dictionary")
+                        self.card_info_changed.emit(f"Invalid card data format: {str(card_data)}")
+                        return
+
+                    if card_data.get('status') == 'error':
+                        self.card_info_changed.emit(f"Error reading card: {card_data.get('message', 'Unknown error')}")
+                        return
                     
-                    # Try to connect to card
-                    connection = None
-                    for reader in available_readers:
-                        try:
-                            connection = reader.createConnection()
-                            connection.connect()
-                            break
-                        except Exception:
-                            continue
+                    # Format the data
+                    output = []
+                    output.append("Card Information:")
+                    output.append(f"Card Type: {card_data.get('card_type', 'Unknown').upper()}")
+                    output.append(f"ATR: {current_atr}")
                     
-                    if connection:
-                        current_atr = toHexString(connection.getATR())
-                        logger.debug(f"New card detected with ATR: {current_atr}")
-                        
-                        # Use QMetaObject.invokeMethod to safely update UI from another thread
-                        QMetaObject.invokeMethod(self.status_text, "setText", 
-                            Qt.ConnectionType.QueuedConnection,
-                            Q_ARG(str, 'Reading card data... Please hold the card'))
-                        
-                        # Detect card type
-                        card_reader = CardReader()
-                        card_type = card_reader.detect_card_type(connection)
-                        
-                        # Update card image based on card type
-                        if card_type:
-                            if card_type.lower() == 'visa' and hasattr(self, 'visa_pixmap'):
-                                QMetaObject.invokeMethod(self.card_image, "setPixmap",
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(QPixmap, self.visa_pixmap))
-                                    
-                            elif card_type.lower() == 'mastercard' and hasattr(self, 'mastercard_pixmap'):
-                                QMetaObject.invokeMethod(self.card_image, "setPixmap",
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(QPixmap, self.mastercard_pixmap))
-                            
-                            # Get current camera info if it exists
-                            current_text = self.card_info.toPlainText()
-                            camera_info = ""
-                            if "Camera Information:" in current_text:
-                                camera_info = current_text.split("Card Information:")[0] if "Card Information:" in current_text else current_text
-                                camera_info += "\n"
-                            
-                            # Read and decode card data
-                            try:
-                                card_data = card_reader.read_card_data(connection, card_type)
-                                if not isinstance(card_data, dict):
-                                    logger.error("Card data is not a dictionary")
-                                    QMetaObject.invokeMethod(self.card_info, "setText",
-                                        Qt.ConnectionType.QueuedConnection,
-                                        Q_ARG(str, f"Invalid card data format: {str(card_data)}"))
-                                    continue
-
-                                if card_data.get('status') == 'error':
-                                    QMetaObject.invokeMethod(self.card_info, "setText",
-                                        Qt.ConnectionType.QueuedConnection,
-                                        Q_ARG(str, f"Error reading card: {card_data.get('message', 'Unknown error')}"))
-                                    continue
-                                
-                                # Format the data
-                                output = []
-                                output.append(camera_info + "Card Information:")
-                                output.append(f"Card Type: {card_data.get('card_type', 'Unknown').upper()}")
-                                output.append(f"ATR: {current_atr}")
-                                
-                                if card_data.get('emv_data'):
-                                    output.append("\n=== EMV Card Data ===")
-                                    for record in card_data['emv_data']:
-                                        if isinstance(record, dict):
-                                            if 'sfi' in record and 'record_number' in record:
-                                                output.append(f"\nSFI: {record['sfi']}, Record: {record['record_number']}")
-                                                output.append("-" * 50)
-                                                output.append("Record Template")
-                                                
-                                            if 'data' in record:
-                                                data = record['data']
-                                                if isinstance(data, dict):
-                                                    for tag_desc, value in data.items():
-                                                        if isinstance(value, list):
-                                                            if tag_desc.startswith("Card Risk Management Data Object List"):  # CDOL1 and CDOL2
-                                                                output.append(f"  {tag_desc}:")
-                                                                for tag_name in value:
-                                                                    output.append(f"    • {tag_name}")
-                                                            elif tag_desc.startswith("Cardholder Verification Method (CVM) List"):
-                                                                output.append(f"  {tag_desc}:")
-                                                                for i, rule in enumerate(value, 1):
-                                                                    output.append(f"    • Rule {i}: {rule}")
-                                                            else:
-                                                                output.append(f"  {tag_desc}: {' '.join(value)}")
-                                                        else:
-                                                            output.append(f"  {tag_desc}: {value}")
-                                                    
-                                # Update card info text
-                                QMetaObject.invokeMethod(self.card_info, "setText",
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(str, '\n'.join(output)))
-                                
-                            except Exception as e:
-                                logger.error(f"Error processing card data: {str(e)}")
-                                QMetaObject.invokeMethod(self.card_info, "setText",
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(str, f"Error processing card: {str(e)}"))
-                                
-                    time.sleep(0.1)  # Small delay to prevent high CPU usage
+                    if card_data.get('emv_data'):
+                        output.append("\n=== EMV Card Data ===")
+                        output.extend(format_emv_records(card_data['emv_data']))
+
+                    # Update card info text
+                    self.card_info_changed.emit('\n'.join(output))
                     
                 except Exception as e:
-                    if "Card is not present" not in str(e):
-                        logger.error(f"Error in card polling: {str(e)}")
-                    time.sleep(0.1)
-                    continue
-                    
+                    logger.error(f"Error processing card data: {str(e)}")
+                    self.card_info_changed.emit(f"Error processing card: {str(e)}")
+
         except Exception as e:
-            logger.error(f"Fatal error in card polling thread: {str(e)}")
+            if "Card is not present" not in str(e):
+                logger.error(f"Error handling card: {str(e)}")
             
 def main():
     try:
         logger.debug("Starting application")
 
-        # Enable debug output for QCamera
-        os.environ['QT_DEBUG_PLUGINS'] = '1'
-
+        # Qt plugin loading can be traced by running with QT_DEBUG_PLUGINS=1
         app = QApplication(sys.argv)
 
         # List available cameras
         available_cameras = QMediaDevices().videoInputs()
         logger.debug("Available cameras:")
         for i, camera in enumerate(available_cameras):
-            logger.debug(f"Camera {i}: {camera.description()}")
+            logger.debug("Camera %d: %s", i, camera.description())
 
         window = CardReaderApp()
         window.show()
@@ -0,0 +1,184 @@
+from types import MappingProxyType
+
+# EMV Tag Definitions (read-only, shared by every reader instance)
+EMV_TAGS = MappingProxyType({
+    # Template Tags
+    '6F': 'File Control Information (FCI) Template',
+    '70': 'Record Template',
+    '77': 'Response Message Template Format 2',
+    '80': 'Response Message Template Format 1',
+    '84': 'Dedicated File (DF) Name',
+    'A5': 'File Control Information (FCI) Proprietary Template',
+    '61': 'Application Template',
+    
+    # Basic Data Elements
+    '42': 'Issuer Identification Number (IIN)',
+    '4F': 'Application Identifier (AID)',
+    '50': 'Application Label',
+    '56': 'Track 1 Equivalent Data (Magnetic Stripe Data)',
+    '57': 'Track 2 Equivalent Data',
+    '5A': 'Application Primary Account Number (PAN)',
+    '5F20': 'Cardholder Name',
+    '5F24': 'Application Expiration Date',
+    '5F25': 'Application Effective Date',
+    '5F28': 'Issuer Country Code',
+    '5F2A': 'Transaction Currency Code',
+    '5F2D': 'Language Preference',
+    '5F30': 'Service Code',
+    '5F34': 'Application PAN Sequence Number',
+    '5F36': 'Transaction Currency Exponent',
+    
+    # Processing Tags
+    '82': 'Application Interchange Profile',
+    '83': 'Command Template',
+    '86': 'Issuer Script Command',
+    '87': 'Application Priority Indicator',
+    '88': 'Short File Identifier (SFI)',
+    '89': 'Authorization Code',
+    '8A': 'Authorization Response Code',
+    '8C': 'Card Risk Management Data Object List 1 (CDOL1)',
+    '8D': 'Card Risk Management Data Object List 2 (CDOL2)',
+    '8E': 'Cardholder Verification Method (CVM) List',
+    '8F': 'Certification Authority Public Key Index',
+    '90': 'Issuer Public Key Certificate',
+    '91': 'Issuer Authentication Data',
+    '92': 'Issuer Public Key Remainder',
+    '93': 'Signed Static Application Data',
+    '94': 'Application File Locator (AFL)',
+    '95': 'Terminal Verification Results',
+    '97': 'Transaction Certificate Data Object List (TDOL)',
+    '98': 'Transaction Certificate (TC) Hash Value',
+    '99': 'Transaction Personal Identification Number (PIN) Data',
+    '9A': 'Transaction Date',
+    '9B': 'Transaction Status Information',
+    '9C': 'Transaction Type',
+    '9D': 'Directory Definition File (DDF) Name',
+    
+    # 9F Series Tags
+    '9F01': 'Acquirer Identifier',
+    '9F02': 'Amount, Authorized (Numeric)',
+    '9F03': 'Amount, Other (Numeric)',
+    '9F04': 'Amount, Other (Binary)',
+    '9F05': 'Application Discretionary Data',
+    '9F06': 'Application Identifier (AID) - Terminal',
+    '9F07': 'Application Usage Control',
+    '9F08': 'Application Version Number',
+    '9F09': 'Application Version Number - Terminal',
+    '9F0B': 'Cardholder Name Extended',
+    '9F0D': 'Issuer Action Code - Default',
+    '9F0E': 'Issuer Action Code - Denial',
+    '9F0F': 'Issuer Action Code - Online',
+    '9F10': 'Issuer Application Data',
+    '9F11': 'Issuer Code Table Index',
+    '9F12': 'Application Preferred Name',
+    '9F13': 'Last Online Application Transaction Counter (ATC) Register',
+    '9F14': 'Lower Consecutive Offline Limit',
+    '9F15': 'Merchant Category Code',
+    '9F16': 'Merchant Identifier',
+    '9F17': 'Personal Identification Number (PIN) Try Counter',
+    '9F18': 'Issuer Script Identifier',
+    '9F1A': 'Terminal Country Code',
+    '9F1B': 'Terminal Floor Limit',
+    '9F1C': 'Terminal Identification',
+    '9F1D': 'Terminal Risk Management Data',
+    '9F1E': 'Interface Device (IFD) Serial Number',
+    '9F1F': 'Track 1 Discretionary Data',
+    '9F20': 'Track 2 Discretionary Data',
+    '9F21': 'Transaction Time',
+    '9F22': 'Certification Authority Public Key Index - Terminal',
+    '9F23': 'Upper Consecutive Offline Limit',
+    '9F26': 'Application Cryptogram',
+    '9F27': 'Cryptogram Information Data',
+    '9F2D': 'ICC PIN Encipherment Public Key Certificate',
+    '9F2E': 'ICC PIN Encipherment Public Key Exponent',
+    '9F2F': 'ICC PIN Encipherment Public Key Remainder',
+    '9F32': 'Issuer Public Key Exponent',
+    '9F33': 'Terminal Capabilities',
+    '9F34': 'Cardholder Verification Method (CVM) Results',
+    '9F35': 'Terminal Type',
+    '9F36': 'Application Transaction Counter (ATC)',
+    '9F37': 'Unpredictable Number',
+    '9F38': 'Processing Options Data Object List (PDOL)',
+    '9F39': 'Point-of-Service (POS) Entry Mode',
+    '9F3A': 'Amount, Reference Currency',
+    '9F3B': 'Application Reference Currency',
+    '9F3C': 'Transaction Reference Currency Code',
+    '9F3D': 'Transaction Reference Currency Exponent',
+    '9F40': 'Additional Terminal Capabilities',
+    '9F41': 'Transaction Sequence Counter',
+    '9F42': 'Application Currency Code',
+    '9F43': 'Application Reference Currency Exponent',
+    '9F44': 'Application Currency Exponent',
+    '9F45': 'Data Authentication Code',
+    '9F46': 'ICC Public Key Certificate',
+    '9F47': 'ICC Public Key Exponent',
+    '9F48': 'ICC Public Key Remainder',
+    '9F49': 'Dynamic Data Authentication Data Object List (DDOL)',
+    '9F4A': 'Static Data Authentication Tag List',
+    '9F4B': 'Signed Dynamic Application Data',
+    '9F4C': 'ICC Dynamic Number',
+    '9F4D': 'Log Entry',
+    '9F4E': 'Merchant Name and Location',
+    '9F4F': 'Log Format',
+    '9F50': 'Offline Accumulator Balance',
+    '9F51': 'DRDOL Related Data',
+    '9F52': 'Terminal Compatibility Indicator',
+    '9F53': 'Consecutive Transaction Limit (International)',
+    '9F54': 'Cumulative Total Transaction Amount Limit',
+    '9F55': 'Geographic Indicator',
+    '9F56': 'Issuer Authentication Indicator',
+    '9F57': 'Issuer Country Code',
+    '9F58': 'Lower Consecutive Offline Limit (International)',
+    '9F59': 'Upper Consecutive Offline Limit (International)',
+    '9F5A': 'Issuer URL2',
+    '9F5B': 'Issuer Script Results',
+    '9F5C': 'Upper Cumulative Total Transaction Amount Limit',
+    '9F66': 'Terminal Transaction Qualifiers (TTQ)',
+    '9F6B': 'Track 2 Equivalent Data (Magnetic Stripe Data)',
+    '9F6C': 'Card Transaction Qualifiers (CTQ)',
+    '9F6E': 'Form Factor Indicator',
+    '9F72': 'Consecutive Transaction International Upper Limit',
+    '9F73': 'Currency Conversion Factor',
+    '9F74': 'VLP Issuer Authorization Code',
+    '9F75': 'Cumulative Total Transaction Amount Upper Limit',
+    '9F76': 'Secondary Application Currency Code',
+    '9F77': 'VLP Funds Limit',
+    '9F78': 'VLP Single Transaction Limit',
+    '9F79': 'VLP Available Funds',
+    '9F7A': 'VLP Single Transaction Limit',
+    '9F7B': 'VLP Transaction Qualifier',
+    '9F7C': 'Customer Exclusive Data',
+    '9F7D': 'Application Specific Transparent Template',
+    
+    # BF Series Tags
+    'BF0C': 'File Control Information (FCI) Issuer Discretionary Data',
+    
+    # Card Scheme Specific
+    'DF8104': 'Balance Read Before Gen AC',
+    'DF8105': 'Balance Read After Gen AC',
+    'DF8106': 'Data Needed',
+    'DF8107': 'CDOL1 Related Data',
+    'DF8108': 'DS AC Type',
+    'DF8109': 'DS Input (Term)',
+    'DF810A': 'DS ODS Info',
+    'DF810B': 'DS Summary 1',
+    'DF810C': 'DS Summary 2',
+    'DF810D': 'DS Summary 3',
+    'DF810E': 'DS Unpredictable Number',
+    'DF810F': 'Message Hold Time',
+    'DF8110': 'Phone Message Table',
+    'DF8111': 'Phone Response Code',
+    'DF8112': 'Script Hold Time',
+    'DF8113': 'Issuer Script Results',
+    'DF8114': 'Post-Gen AC Put Data Status',
+    'DF8115': 'Pre-Gen AC Put Data Status',
+    'DF8116': 'Proceed To First Write Flag',
+    'DF8117': 'PDOL Related Data',
+    'DF8118': 'Tags To Read',
+    'DF8119': 'Tags To Write Before Gen AC',
+    'DF811A': 'Tags To Write After Gen AC',
+    'DF811B': 'Data To Send',
+    'DF811C': 'Data Record',
+    'DF811D': 'Encryption Key',
+    'DF811E': 'Encrypted Data'
+})